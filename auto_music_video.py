@@ -11,27 +11,32 @@ pipeline writes out a storyboard JSON file instead of rendering a video.
 from __future__ import annotations
 
 import argparse
-import dataclasses
-import importlib.util
 import json
 import re
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, fields
+from itertools import cycle, islice, repeat
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Iterator, List, Optional, Sequence
 
 # Optional dependencies
-LIBROSA_AVAILABLE = importlib.util.find_spec("librosa") is not None
-PYDUB_AVAILABLE = importlib.util.find_spec("pydub") is not None
-MANIM_AVAILABLE = importlib.util.find_spec("manim") is not None
-PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
-
-if LIBROSA_AVAILABLE:
+try:
     import librosa
+    import soundfile
+except ImportError:
+    librosa = None
+
+try:
+    from madmom.features.beats import DBNBeatTrackingProcessor, RNNBeatProcessor
+except ImportError:
+    DBNBeatTrackingProcessor = RNNBeatProcessor = None
 
-if PYDUB_AVAILABLE:
+try:
     from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None
 
-if MANIM_AVAILABLE:
+try:
     from manim import (
         BLUE,
         GREEN,
@@ -47,12 +52,34 @@ if MANIM_AVAILABLE:
         VGroup,
     )
     from manim.utils.color import rgb_to_color
+except ImportError:
+    MANIM_AVAILABLE = False
+else:
+    MANIM_AVAILABLE = True
 
-if PIL_AVAILABLE:
+try:
     from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_STREAM_BLOCK_LENGTH = 256
+_FRAME_LENGTH = 2048
+_HOP_LENGTH = 512
 
+_PERSIAN_RE = re.compile(r"[\u0600-\u06FF]")
+_FA_DIGITS = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
 
-@dataclass
+
+def _fa_digits(text: str) -> str:
+    return text.translate(_FA_DIGITS)
+
+
+@dataclass(slots=True)
 class MusicAnalysis:
     tempo: float
     beats: List[float]
@@ -62,7 +89,7 @@ class MusicAnalysis:
     genre_hint: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LyricLine:
     raw_text: str
     processed_text: str
@@ -74,14 +101,14 @@ class LyricLine:
     color: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationDirective:
     line: LyricLine
     animation_style: str
     intensity: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorPalette:
     primary: str
     secondary: str
@@ -97,7 +124,11 @@ class AutoMusicVideoGenerator:
     """
 
     def __init__(self) -> None:
-        self.palette_cache: dict[Path, ColorPalette] = {}
+        self.palette_cache: dict[tuple[Path, int, int], ColorPalette] = {}
+        self.font_size_cache: dict[tuple[Path, int, int], int] = {}
+        # madmom's RNN models are expensive to load, so keep them across songs.
+        self._beat_activations: Optional["RNNBeatProcessor"] = None
+        self._beat_tracker: Optional["DBNBeatTrackingProcessor"] = None
 
     # -------------------------- Public API ---------------------------------
     def process_all_inputs(self, lyrics_path: str, music_path: str, video_path: str) -> Path:
@@ -112,20 +143,29 @@ class AutoMusicVideoGenerator:
 
     # -------------------------- Music analysis ------------------------------
     def analyze_music(self, music_path: Path) -> MusicAnalysis:
-        if LIBROSA_AVAILABLE:
-            y, sr = librosa.load(music_path, sr=None, mono=True)
-            tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr)
-            beats = librosa.frames_to_time(beat_frames, sr=sr).tolist()
-            onset_env = librosa.onset.onset_strength(y=y, sr=sr).tolist()
+        if librosa is not None:
+            sr, onset_env, rms, duration, frame_n_fft = self._audio_features(music_path)
+            tracked = self._track_beats_madmom(music_path)
+            if tracked is not None:
+                tempo, beats = tracked
+            else:
+                tempo, beat_frames = librosa.beat.beat_track(onset_envelope=onset_env, sr=sr, hop_length=_HOP_LENGTH)
+                # Recent librosa versions return the tempo as a one-element array.
+                tempo = float(np.atleast_1d(tempo)[0])
+                beats = librosa.frames_to_time(
+                    beat_frames, sr=sr, hop_length=_HOP_LENGTH, n_fft=frame_n_fft
+                ).tolist()
             energy = self._normalize_curve(onset_env, target_points=200)
-            harmonic, percussive = librosa.effects.hpss(y)
-            vocal_energy = self._normalize_curve(harmonic.tolist(), target_points=200)
-            duration = librosa.get_duration(y=y, sr=sr)
-        elif PYDUB_AVAILABLE:
+            vocal_energy = self._normalize_curve(rms, target_points=200)
+        elif AudioSegment is not None:
             audio = AudioSegment.from_file(music_path)
             duration = len(audio) / 1000.0
-            tempo = self._estimate_tempo_from_envelope(audio)
-            beats = self._distribute_beats(duration, tempo)
+            tracked = self._track_beats_madmom(music_path)
+            if tracked is not None:
+                tempo, beats = tracked
+            else:
+                tempo = self._estimate_tempo_from_envelope(audio)
+                beats = self._distribute_beats(duration, tempo)
             envelope = [segment.dBFS for segment in audio[::200]] or [audio.dBFS]
             energy = self._normalize_curve(envelope, target_points=200)
             vocal_energy = energy
@@ -146,6 +186,80 @@ class AutoMusicVideoGenerator:
             genre_hint=genre_hint,
         )
 
+    def _audio_features(
+        self, music_path: Path
+    ) -> tuple[int, "np.ndarray", "np.ndarray", float, Optional[int]]:
+        # The last item is the ``n_fft`` to pass to ``frames_to_time``: streamed
+        # frames are not centered, so frame ``i`` starts at ``i * hop`` and its
+        # time is offset by half a frame; the whole-file path uses centered
+        # frames and needs no offset.
+        try:
+            info = soundfile.info(str(music_path))
+        except RuntimeError:
+            # librosa.stream only reads through libsndfile; formats it cannot
+            # decode (AAC/m4a, mp3 on older libsndfile) go through librosa.load,
+            # which falls back to audioread.
+            y, sr = librosa.load(music_path, sr=None, mono=True)
+            onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=_HOP_LENGTH)
+            rms = librosa.feature.rms(y=y, frame_length=_FRAME_LENGTH, hop_length=_HOP_LENGTH)[0]
+            return sr, onset_env, rms, librosa.get_duration(y=y, sr=sr), None
+        onset_env, rms = self._stream_audio_features(music_path, info.samplerate, info.frames)
+        return info.samplerate, onset_env, rms, info.duration, _FRAME_LENGTH
+
+    def _stream_audio_features(
+        self, music_path: Path, sr: int, n_samples: int
+    ) -> tuple["np.ndarray", "np.ndarray"]:
+        # Process the file block by block so memory stays flat regardless of
+        # song length; frames do not straddle blocks, hence center=False.
+        onset_blocks = []
+        rms_blocks = []
+        previous_frame = None
+        stream = librosa.stream(
+            str(music_path),
+            block_length=_STREAM_BLOCK_LENGTH,
+            frame_length=_FRAME_LENGTH,
+            hop_length=_HOP_LENGTH,
+            mono=True,
+            fill_value=0.0,
+        )
+        for block in stream:
+            # No top_db clipping: it is relative to each block's peak and would
+            # make the envelope depend on where the block boundaries fall.
+            mel_db = librosa.power_to_db(
+                librosa.feature.melspectrogram(
+                    y=block, sr=sr, n_fft=_FRAME_LENGTH, hop_length=_HOP_LENGTH, center=False
+                ),
+                top_db=None,
+            )
+            if previous_frame is None:
+                onset = librosa.onset.onset_strength(S=mel_db, sr=sr, center=False)
+            else:
+                # Diff the first frame against the previous block's last one so
+                # the envelope does not drop to zero at every block boundary.
+                extended = np.concatenate((previous_frame, mel_db), axis=1)
+                onset = librosa.onset.onset_strength(S=extended, sr=sr, center=False)[1:]
+            previous_frame = mel_db[:, -1:]
+            onset_blocks.append(onset)
+            rms_blocks.append(
+                librosa.feature.rms(y=block, frame_length=_FRAME_LENGTH, hop_length=_HOP_LENGTH, center=False)[0]
+            )
+        # The final block is padded with silence; keep only frames backed by audio.
+        n_frames = 1 + max(0, n_samples - _FRAME_LENGTH) // _HOP_LENGTH
+        return np.concatenate(onset_blocks)[:n_frames], np.concatenate(rms_blocks)[:n_frames]
+
+    def _track_beats_madmom(self, music_path: Path) -> Optional[tuple[float, List[float]]]:
+        if RNNBeatProcessor is None:
+            return None
+        if self._beat_activations is None:
+            self._beat_activations = RNNBeatProcessor()
+            self._beat_tracker = DBNBeatTrackingProcessor(fps=100)
+        activations = self._beat_activations(str(music_path))
+        beats = self._beat_tracker(activations)
+        if len(beats) < 2:
+            return None
+        tempo = 60.0 / float(np.median(np.diff(beats)))
+        return tempo, beats.tolist()
+
     def _probe_duration_fallback(self, music_path: Path) -> float:
         try:
             size_seconds = music_path.stat().st_size / 100000.0
@@ -166,11 +280,22 @@ class AutoMusicVideoGenerator:
             return []
         interval = 60.0 / tempo
         count = max(1, int(duration / interval))
+        if np is not None:
+            return (np.arange(count) * interval).round(2).tolist()
         return [round(i * interval, 2) for i in range(count)]
 
     def _normalize_curve(self, values: Sequence[float], target_points: int = 200) -> List[float]:
-        if not values:
+        if len(values) == 0:
             return [0.5 for _ in range(target_points)]
+        if np is not None:
+            curve = np.asarray(values, dtype=np.float64)
+            min_val = curve.min()
+            normalized_curve = (curve - min_val) / (curve.max() - min_val + 1e-9)
+            if len(normalized_curve) == target_points:
+                return normalized_curve.tolist()
+            step = max(1, len(normalized_curve) / target_points)
+            indices = (np.arange(target_points) * step).astype(np.int64)
+            return normalized_curve[indices].tolist()
         min_val = min(values)
         max_val = max(values)
         normalized = [(v - min_val) / (max_val - min_val + 1e-9) for v in values]
@@ -200,28 +325,34 @@ class AutoMusicVideoGenerator:
         return cleaned_lines
 
     def _auto_break_line(self, line: str, max_chars: int = 32) -> List[str]:
+        if self._is_persian(line):
+            line = _fa_digits(line)
         if len(line) <= max_chars:
             return [self._apply_rtl(line)]
         words = line.split()
         bucket: List[str] = []
+        # Characters in the bucket plus one separator per word, kept incrementally.
+        bucket_len = 0
         lines: List[str] = []
         for word in words:
-            if sum(len(w) for w in bucket) + len(bucket) + len(word) > max_chars:
+            if bucket_len + len(word) > max_chars:
                 lines.append(self._apply_rtl(" ".join(bucket)))
                 bucket = [word]
+                bucket_len = len(word) + 1
             else:
                 bucket.append(word)
+                bucket_len += len(word) + 1
         if bucket:
             lines.append(self._apply_rtl(" ".join(bucket)))
         return lines
 
     def _apply_rtl(self, line: str) -> str:
         if self._is_persian(line):
-            return "".join(reversed(line))
+            return line[::-1]
         return line
 
     def _is_persian(self, line: str) -> bool:
-        return bool(re.search(r"[\u0600-\u06FF]", line))
+        return _PERSIAN_RE.search(line) is not None
 
     # -------------------------- Animation directives -----------------------
     def auto_generate_animations(
@@ -231,20 +362,19 @@ class AutoMusicVideoGenerator:
         beat_interval = beats[1] - beats[0] if len(beats) > 1 else 60.0 / analysis.tempo
         palette = self._extract_palette(video_path)
 
+        line_counts = Counter(lines)
+        line_words = [line.split() for line in lines]
+        starts, ends = self._line_timings(line_words, beats, beat_interval)
         directives: List[AnimationDirective] = []
-        cursor = 0.0
         energy_iter = self._loop_values(analysis.energy, len(lines))
-        for idx, line in enumerate(lines):
-            duration = max(beat_interval * 2, beat_interval * len(line.split()) * 0.6)
-            start = beats[idx] if idx < len(beats) else cursor
-            end = start + duration
-            emphasis = lines.count(line) > 1
+        for idx, (line, words, start, end) in enumerate(zip(lines, line_words, starts, ends)):
+            emphasis = line_counts[line] > 1
             anchor = "center" if idx % 2 == 0 else "bottom"
             color = self._pick_color(palette, emphasis)
             lyric_line = LyricLine(
                 raw_text=line,
                 processed_text=line,
-                words=line.split(),
+                words=words,
                 start=start,
                 end=end,
                 emphasis=emphasis,
@@ -254,18 +384,40 @@ class AutoMusicVideoGenerator:
             intensity = next(energy_iter)
             animation_style = self._pick_animation_style(analysis.genre_hint, intensity)
             directives.append(AnimationDirective(line=lyric_line, animation_style=animation_style, intensity=intensity))
-            cursor = end
         return directives
 
-    def _loop_values(self, values: Sequence[float], length: int) -> Iterable[float]:
+    def _line_timings(
+        self, line_words: List[List[str]], beats: Sequence[float], beat_interval: float
+    ) -> tuple[List[float], List[float]]:
+        # Lines start on successive beats; once the beats run out each line
+        # starts where the previous one ended.
+        count = len(line_words)
+        if np is not None:
+            word_counts = np.fromiter((len(words) for words in line_words), dtype=np.float64, count=count)
+            durations = np.maximum(beat_interval * 2, beat_interval * word_counts * 0.6)
+            on_beat = min(len(beats), count)
+            start_times = np.empty(count, dtype=np.float64)
+            start_times[:on_beat] = beats[:on_beat]
+            if on_beat < count:
+                cursor = start_times[on_beat - 1] + durations[on_beat - 1] if on_beat else 0.0
+                start_times[on_beat:] = np.cumsum(np.concatenate(([cursor], durations[on_beat:-1])))
+            return start_times.tolist(), (start_times + durations).tolist()
+
+        starts: List[float] = []
+        ends: List[float] = []
+        cursor = 0.0
+        for idx, words in enumerate(line_words):
+            duration = max(beat_interval * 2, beat_interval * len(words) * 0.6)
+            start = beats[idx] if idx < len(beats) else cursor
+            cursor = start + duration
+            starts.append(start)
+            ends.append(cursor)
+        return starts, ends
+
+    def _loop_values(self, values: Sequence[float], length: int) -> Iterator[float]:
         if not values:
-            for _ in range(length):
-                yield 0.5
-        else:
-            idx = 0
-            for _ in range(length):
-                yield values[idx % len(values)]
-                idx += 1
+            return islice(repeat(0.5), length)
+        return islice(cycle(values), length)
 
     def _pick_animation_style(self, genre: str, intensity: float) -> str:
         if genre == "electronic":
@@ -277,27 +429,42 @@ class AutoMusicVideoGenerator:
         return "slow-fade"
 
     def _extract_palette(self, video_path: Path) -> ColorPalette:
-        if video_path in self.palette_cache:
-            return self.palette_cache[video_path]
-        if PIL_AVAILABLE and video_path.exists():
+        cache_key = self._media_cache_key(video_path)
+        if cache_key in self.palette_cache:
+            return self.palette_cache[cache_key]
+        if Image is not None and video_path.exists():
             with Image.open(video_path) as img:
                 resized = img.resize((8, 8))
-                colors = resized.convert("RGB").getdata()
-                avg = tuple(sum(channel) / len(colors) for channel in zip(*colors))
+                if np is not None:
+                    pixels = np.asarray(resized.convert("RGB"), dtype=np.float64).reshape(-1, 3)
+                    avg = tuple(pixels.mean(axis=0).tolist())
+                else:
+                    colors = resized.convert("RGB").getdata()
+                    avg = tuple(sum(channel) / len(colors) for channel in zip(*colors))
                 primary = self._rgb_to_hex(avg)
                 secondary = self._rgb_to_hex((avg[0] * 0.8, avg[1] * 0.8, avg[2] * 0.9))
                 accent = self._rgb_to_hex((255 - avg[0], 255 - avg[1], 255 - avg[2]))
                 palette = ColorPalette(primary=primary, secondary=secondary, accent=accent)
         else:
             palette = ColorPalette("#d5c4a1", "#83a598", "#fb4934")
-        self.palette_cache[video_path] = palette
+        self.palette_cache[cache_key] = palette
         return palette
 
+    def _media_cache_key(self, path: Path) -> tuple[Path, int, int]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return (path, -1, -1)
+        return (path, stat.st_mtime_ns, stat.st_size)
+
     def _pick_color(self, palette: ColorPalette, emphasis: bool) -> str:
         return palette.accent if emphasis else palette.primary
 
     def _rgb_to_hex(self, rgb: Sequence[float]) -> str:
-        return "#%02x%02x%02x" % tuple(int(min(255, max(0, c))) for c in rgb)
+        red = min(255, max(0, int(rgb[0])))
+        green = min(255, max(0, int(rgb[1])))
+        blue = min(255, max(0, int(rgb[2])))
+        return f"#{(red << 16) | (green << 8) | blue:06x}"
 
     # -------------------------- Rendering ----------------------------------
     def render_auto_video(
@@ -324,14 +491,14 @@ class AutoMusicVideoGenerator:
     ) -> Path:
         class AutoLyricsScene(Scene):
             def construct(self_inner) -> None:
-                palette = self._extract_palette(video_path)
+                font_size = self._font_size_from_video(video_path)
                 text_group = VGroup()
                 for directive in directives:
                     color = rgb_to_color(self._hex_to_rgb_tuple(directive.line.color))
                     text = Text(
                         directive.line.processed_text,
                         color=color,
-                        font_size=self._font_size_from_video(video_path),
+                        font_size=font_size,
                     )
                     self_inner._position_text(text, directive.line.anchor)
                     text_group.add(text)
@@ -368,15 +535,21 @@ class AutoMusicVideoGenerator:
         return tuple(int(hex_value[i : i + 2], 16) for i in (0, 2, 4))
 
     def _font_size_from_video(self, video_path: Path) -> int:
-        if PIL_AVAILABLE and video_path.exists():
+        cache_key = self._media_cache_key(video_path)
+        if cache_key in self.font_size_cache:
+            return self.font_size_cache[cache_key]
+        if Image is not None and video_path.exists():
             with Image.open(video_path) as img:
                 base = max(img.size) / 20
-                return int(max(24, min(72, base)))
-        return 48
+                font_size = int(max(24, min(72, base)))
+        else:
+            font_size = 48
+        self.font_size_cache[cache_key] = font_size
+        return font_size
 
     def _serialize_storyboard(self, directives: List[AnimationDirective], analysis: MusicAnalysis) -> str:
         data = {
-            "analysis": dataclasses.asdict(analysis),
+            "analysis": {field.name: getattr(analysis, field.name) for field in fields(analysis)},
             "timeline": [
                 {
                     "text": directive.line.processed_text,
@@ -2,18 +2,22 @@
 
 Running ``python -m http.server`` can log a stream of ``400 Bad request version``
 errors when a browser (or background service) accidentally opens an HTTPS
-connection to the HTTP port. This module provides a small wrapper around
-``ThreadingHTTPServer`` that detects TLS handshakes on the wrong port and
+connection to the HTTP port. This module provides a small HTTP server backed
+by a fixed thread pool that detects TLS handshakes on the wrong port and
 logs a concise hint instead of emitting noisy 400 errors.
 """
 
 from __future__ import annotations
 
 import argparse
+import os
+import queue
 import socket
+import stat
+import threading
 from functools import partial
-from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
-from typing import Tuple
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from typing import Optional, Tuple
 
 
 def _looks_like_tls_handshake(data: bytes) -> bool:
@@ -24,13 +28,46 @@ def _looks_like_tls_handshake(data: bytes) -> bool:
     probes that start with a two-byte record length.
     """
 
-    return data.startswith((b"\x16\x03", b"\x00\x02\x01\x00"))
+    if len(data) < 2:
+        return False
+    if data[0] == 0x16 and data[1] == 0x03:
+        return True
+    return data[:4] == b"\x00\x02\x01\x00"
+
+
+def _is_regular_file(source) -> bool:
+    try:
+        return stat.S_ISREG(os.fstat(source.fileno()).st_mode)
+    except (AttributeError, OSError, ValueError):
+        return False
 
 
 class FriendlyHTTPRequestHandler(SimpleHTTPRequestHandler):
     """HTTP handler that ignores TLS handshakes on the HTTP port."""
 
     server_version = "FriendlyHTTP/1.0"
+    # Drop idle connections (e.g. browser preconnects) so they cannot pin a
+    # worker indefinitely in the TLS peek or request-line read.
+    timeout = 10
+
+    def handle(self) -> None:
+        # Peek at the first bytes so TLS probes are rejected before ``rfile``
+        # buffers (up to 64 KiB of) handshake data as a request line.
+        try:
+            head = self.connection.recv(4, socket.MSG_PEEK)
+        except socket.timeout:
+            # Idle connection (typically a browser preconnect); close quietly.
+            return
+        except ConnectionResetError as exc:
+            self.log_error("connection peek failed: %s", exc)
+            return
+
+        if _looks_like_tls_handshake(head):
+            self.log_message("ignored TLS handshake on HTTP port; use https:// or plain http://")
+            self.close_connection = True
+            return
+
+        super().handle()
 
     def handle_one_request(self) -> None:  # noqa: WPS213
         try:
@@ -61,6 +98,56 @@ class FriendlyHTTPRequestHandler(SimpleHTTPRequestHandler):
         method()
         self.wfile.flush()
 
+    def copyfile(self, source, outputfile) -> None:
+        """Send regular files with ``sendfile(2)`` instead of copying through Python."""
+
+        if outputfile is self.wfile and _is_regular_file(source):
+            self.connection.sendfile(source)
+            return
+        super().copyfile(source, outputfile)
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTP server that hands connections to a reusable pool of worker threads.
+
+    ``ThreadingHTTPServer`` starts a new thread per connection, which dominates
+    the cost of serving many small static assets. Reusing a fixed set of
+    workers keeps concurrency without the per-connection thread start-up.
+    Workers are daemon threads, like ``ThreadingHTTPServer``'s, so a worker
+    blocked on a slow client never delays interpreter exit.
+    """
+
+    def __init__(self, server_address, handler_class, max_workers: int = 16) -> None:
+        super().__init__(server_address, handler_class)
+        self._pending: "queue.Queue[Optional[Tuple[socket.socket, Tuple[str, int]]]]" = queue.Queue()
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"http-{index}", daemon=True)
+            for index in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def process_request(self, request, client_address) -> None:
+        self._pending.put((request, client_address))
+
+    def _worker_loop(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        for _ in self._workers:
+            self._pending.put(None)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Serve the demo UI without TLS noise.")
@@ -70,6 +157,12 @@ def parse_args() -> argparse.Namespace:
         default=".",
         help="Directory to serve (default: current working directory)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="Number of worker threads handling connections (default: 16)",
+    )
     return parser.parse_args()
 
 
@@ -78,7 +171,7 @@ def main() -> None:
     handler_factory = partial(FriendlyHTTPRequestHandler, directory=args.directory)
     address: Tuple[str, int] = ("0.0.0.0", args.port)
 
-    with ThreadingHTTPServer(address, handler_factory) as httpd:
+    with PooledHTTPServer(address, handler_factory, max_workers=args.workers) as httpd:
         print(f"Serving {args.directory!r} on http://{address[0]}:{address[1]} (Ctrl+C to stop)")
         try:
             httpd.serve_forever()
@@ -1,58 +1,66 @@
 """Application configuration for default settings and constants."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResolutionSetting:
     label: str
     width: int
     height: int
 
 
-@dataclass
+_FONTS: Tuple[str, ...] = (
+    "Vazir",
+    "Nazli",
+    "Sahel",
+    "Shabnam",
+)
+_RESOLUTIONS: Tuple[ResolutionSetting, ...] = (
+    ResolutionSetting("720p", 1280, 720),
+    ResolutionSetting("1080p", 1920, 1080),
+    ResolutionSetting("4K", 3840, 2160),
+)
+_FPS_OPTIONS: Tuple[int, ...] = (24, 30, 60)
+_OUTPUT_FORMATS: Tuple[str, ...] = ("mp4", "gif")
+_TRANSITION_STYLES: Tuple[str, ...] = (
+    "fade",
+    "slide",
+    "typewriter",
+    "scroll",
+    "crossfade",
+)
+_ANIMATION_STYLES: Mapping[str, str] = MappingProxyType(
+    {
+        "typewriter": "نوشتار ماشینی",
+        "fade": "محو شدنی",
+        "scroll": "حرکت عمودی",
+        "reveal": "نمایش تدریجی",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
 class DefaultConfig:
-    """Container for default UI and rendering settings."""
-
-    fonts: List[str] = field(
-        default_factory=lambda: [
-            "Vazir",
-            "Nazli",
-            "Sahel",
-            "Shabnam",
-        ]
-    )
-    resolutions: List[ResolutionSetting] = field(
-        default_factory=lambda: [
-            ResolutionSetting("720p", 1280, 720),
-            ResolutionSetting("1080p", 1920, 1080),
-            ResolutionSetting("4K", 3840, 2160),
-        ]
-    )
-    fps_options: List[int] = field(default_factory=lambda: [24, 30, 60])
-    output_formats: List[str] = field(default_factory=lambda: ["mp4", "gif"])
-    transition_styles: List[str] = field(
-        default_factory=lambda: [
-            "fade",
-            "slide",
-            "typewriter",
-            "scroll",
-            "crossfade",
-        ]
-    )
-    animation_styles: Dict[str, str] = field(
-        default_factory=lambda: {
-            "typewriter": "نوشتار ماشینی",
-            "fade": "محو شدنی",
-            "scroll": "حرکت عمودی",
-            "reveal": "نمایش تدریجی",
-        }
-    )
+    """Container for default UI and rendering settings.
+
+    The defaults are immutable so a single instance can be shared by every caller.
+    """
+
+    fonts: Tuple[str, ...] = _FONTS
+    resolutions: Tuple[ResolutionSetting, ...] = _RESOLUTIONS
+    fps_options: Tuple[int, ...] = _FPS_OPTIONS
+    output_formats: Tuple[str, ...] = _OUTPUT_FORMATS
+    transition_styles: Tuple[str, ...] = _TRANSITION_STYLES
+    animation_styles: Mapping[str, str] = field(default_factory=lambda: _ANIMATION_STYLES)
     sample_text: str = (
         "سلام! این یک متن آزمایشی برای ساخت موشن گرافیک فارسی است."
     )
 
 
+@lru_cache(maxsize=1)
 def load_default_config() -> DefaultConfig:
     return DefaultConfig()
@@ -1,17 +1,33 @@
 """Logging utilities for the Persian Motion Graphics Creator."""
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Optional
 
 LOG_PATH = Path("logs")
 LOG_FILE = LOG_PATH / "application.log"
 
+_listener: Optional[QueueListener] = None
+
 
 def configure_logging() -> None:
+    global _listener
+    if _listener is not None:
+        return
+
     LOG_PATH.mkdir(parents=True, exist_ok=True)
-    logging.basicConfig(
-        filename=LOG_FILE,
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    )
+    file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
     logging.getLogger(__name__).info("Logging initialized. Log file at %s", LOG_FILE)
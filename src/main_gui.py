@@ -3,6 +3,7 @@
 import json
 import logging
 from pathlib import Path
+from typing import Optional
 from tkinter import (  # noqa: WPS347
     BOTH,
     END,
@@ -30,6 +31,9 @@ from .video_processor import VideoProcessor
 
 logger = logging.getLogger(__name__)
 
+PREVIEW_REFRESH_DELAY_MS = 80
+TRIM_COMMIT_DELAY_MS = 30
+
 
 class MainGUI:
     """Primary window with tabs for text, video, animation, and export settings."""
@@ -43,15 +47,23 @@ class MainGUI:
 
         self.text_animator = PersianTextAnimator(default_font=self.config.fonts[0])
         self.video_processor = VideoProcessor()
+        self._resolution_by_label = {res.label: res for res in self.config.resolutions}
+        self._resolution_labels = tuple(self._resolution_by_label)
+        self._animation_style_names = tuple(self.config.animation_styles)
         self.selected_resolution: ResolutionSetting = self.config.resolutions[1]
         self.selected_fps: int = self.config.fps_options[0]
         self.selected_format: StringVar = StringVar(value=self.config.output_formats[0])
         self.progress_var = StringVar(value="0%")
         self.status_var = StringVar(value="آماده")
         self.text_color_var = StringVar(value="#ffffff")
+        self._preview_after_id: Optional[str] = None
+        self._trim_after_id: Optional[str] = None
+        self._last_preview_state: Optional[tuple] = None
+        self._current_font: str = self.config.fonts[0]
+        self._current_size: int = 36
 
         self._build_layout()
-        self._setup_renderer()
+        self._build_renderer()
 
     def _build_layout(self) -> None:
         notebook = ttk.Notebook(self.window)
@@ -86,21 +98,21 @@ class MainGUI:
         font_frame = Frame(self.text_tab)
         font_frame.pack(fill="x", padx=10, pady=5)
         Label(font_frame, text="فونت:").pack(side=LEFT)
-        self.font_var = StringVar(value=self.config.fonts[0])
+        self.font_var = StringVar(value=self._current_font)
         font_dropdown = ttk.Combobox(font_frame, textvariable=self.font_var, values=self.config.fonts)
         font_dropdown.pack(side=LEFT)
 
         Label(font_frame, text="حجم فونت:").pack(side=LEFT, padx=10)
-        self.size_var = StringVar(value="36")
+        self.size_var = StringVar(value=str(self._current_size))
         size_dropdown = ttk.Combobox(font_frame, textvariable=self.size_var, values=["24", "32", "36", "48", "60"])
         size_dropdown.pack(side=LEFT)
 
         Label(font_frame, text="جلوه:").pack(side=LEFT, padx=10)
-        self.animation_style_var = StringVar(value=list(self.config.animation_styles.keys())[0])
+        self.animation_style_var = StringVar(value=self._animation_style_names[0])
         animation_dropdown = ttk.Combobox(
             font_frame,
             textvariable=self.animation_style_var,
-            values=list(self.config.animation_styles.keys()),
+            values=self._animation_style_names,
         )
         animation_dropdown.pack(side=LEFT)
 
@@ -111,17 +123,24 @@ class MainGUI:
 
         self.preview_canvas = Canvas(self.text_tab, height=120, bg="#f2f2f2")
         self.preview_canvas.pack(fill="x", padx=10, pady=10)
-        self.preview_canvas.create_text(
-            580,
-            60,
-            text=self.text_animator.reshape_text(self.config.sample_text),
-            font=(self.font_var.get(), 20),
-            fill=self.text_color_var.get(),
-        )
-
-        self.body_input.bind("<KeyRelease>", lambda _event: self._refresh_text_preview())
-        self.font_var.trace_add("write", lambda *_: self._refresh_text_preview())
-        self.size_var.trace_add("write", lambda *_: self._refresh_text_preview())
+        self._title_item = self.preview_canvas.create_text(580, 40)
+        self._body_item = self.preview_canvas.create_text(580, 90)
+        self._refresh_text_preview()
+
+        self.body_input.bind("<KeyRelease>", lambda _event: self._schedule_preview_refresh())
+        self.font_var.trace_add("write", self._on_font_change)
+        self.size_var.trace_add("write", self._on_size_change)
+
+    def _on_font_change(self, *_args: object) -> None:
+        self._current_font = self.font_var.get()
+        self._schedule_preview_refresh()
+
+    def _on_size_change(self, *_args: object) -> None:
+        try:
+            self._current_size = int(self.size_var.get())
+        except ValueError:
+            return
+        self._schedule_preview_refresh()
 
     def _choose_color(self, preview_label: Label) -> None:
         color = colorchooser.askcolor(initialcolor=self.text_color_var.get())
@@ -130,23 +149,33 @@ class MainGUI:
             preview_label.configure(bg=color[1])
             self._refresh_text_preview()
 
+    def _schedule_preview_refresh(self) -> None:
+        # Coalesce bursts of keystrokes into a single reshape + redraw.
+        if self._preview_after_id:
+            self.window.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.window.after(PREVIEW_REFRESH_DELAY_MS, self._refresh_text_preview)
+
     def _refresh_text_preview(self) -> None:
-        self.preview_canvas.delete("all")
-        reshaped_title = self.text_animator.reshape_text(self.title_input.get())
-        reshaped_body = self.text_animator.reshape_text(self.body_input.get("1.0", END))
-        self.preview_canvas.create_text(
-            580,
-            40,
-            text=reshaped_title,
-            font=(self.font_var.get(), int(self.size_var.get())),
-            fill=self.text_color_var.get(),
+        self._preview_after_id = None
+        title_text = self.title_input.get()
+        body_text = self.body_input.get("1.0", END)
+        color = self.text_color_var.get()
+        preview_state = (title_text, body_text, self._current_font, self._current_size, color)
+        if preview_state == self._last_preview_state:
+            return
+        self._last_preview_state = preview_state
+
+        self.preview_canvas.itemconfigure(
+            self._title_item,
+            text=self.text_animator.reshape_text(title_text),
+            font=(self._current_font, self._current_size),
+            fill=color,
         )
-        self.preview_canvas.create_text(
-            580,
-            90,
-            text=reshaped_body,
-            font=(self.font_var.get(), max(16, int(self.size_var.get()) - 4)),
-            fill=self.text_color_var.get(),
+        self.preview_canvas.itemconfigure(
+            self._body_item,
+            text=self.text_animator.reshape_multiline(body_text),
+            font=(self._current_font, max(16, self._current_size - 4)),
+            fill=color,
         )
 
     def _build_video_tab(self) -> None:
@@ -201,9 +230,8 @@ class MainGUI:
         res_frame = Frame(self.export_tab)
         res_frame.pack(fill="x", padx=10, pady=5)
         Label(res_frame, text="وضوح:").pack(side=LEFT)
-        res_values = [res.label for res in self.config.resolutions]
         self.resolution_var = StringVar(value=self.selected_resolution.label)
-        resolution_dropdown = ttk.Combobox(res_frame, textvariable=self.resolution_var, values=res_values)
+        resolution_dropdown = ttk.Combobox(res_frame, textvariable=self.resolution_var, values=self._resolution_labels)
         resolution_dropdown.pack(side=LEFT)
         resolution_dropdown.bind("<<ComboboxSelected>>", self._on_resolution_change)
 
@@ -228,20 +256,26 @@ class MainGUI:
         self.status_label = Label(self.export_tab, textvariable=self.status_var)
         self.status_label.pack(anchor="w", padx=10)
 
-    def _setup_renderer(self) -> None:
-        scene_config = SceneConfig(
-            width=self.selected_resolution.width,
-            height=self.selected_resolution.height,
-            fps=self.selected_fps,
-        )
-        self.composer = SceneComposer(config=scene_config)
+    def _build_renderer(self) -> None:
+        self.composer = SceneComposer(config=self._current_scene_config())
         self.render_manager = RenderManager(
             composer=self.composer,
             output_dir=Path("output"),
-            progress_callback=self._on_render_progress,
-            completion_callback=self._on_render_complete,
+            # Render callbacks fire on the worker thread; hop back to Tk's thread.
+            progress_callback=lambda value: self.window.after(0, self._on_render_progress, value),
+            completion_callback=lambda output: self.window.after(0, self._on_render_complete, output),
         )
 
+    def _current_scene_config(self) -> SceneConfig:
+        return SceneConfig(
+            width=self.selected_resolution.width,
+            height=self.selected_resolution.height,
+            fps=self.selected_fps,
+        )
+
+    def _update_scene_config(self) -> None:
+        self.composer.update_config(self._current_scene_config())
+
     def _browse_video(self) -> None:
         file_path = filedialog.askopenfilename(filetypes=[("Video files", "*.mp4 *.mov *.avi")])
         if file_path:
@@ -256,32 +290,36 @@ class MainGUI:
         self.video_processor.set_volume(float(value))
 
     def _on_trim_change(self, _value: str) -> None:
+        # Both trim sliders fire on every pixel of a drag; commit once it settles.
+        if self._trim_after_id:
+            self.window.after_cancel(self._trim_after_id)
+        self._trim_after_id = self.window.after(TRIM_COMMIT_DELAY_MS, self._commit_trim)
+
+    def _commit_trim(self) -> None:
+        self._trim_after_id = None
         self.video_processor.update_trim(float(self.start_time.get()), float(self.end_time.get()))
 
     def _on_resolution_change(self, _event: object) -> None:
-        selected_label = self.resolution_var.get()
-        for res in self.config.resolutions:
-            if res.label == selected_label:
-                self.selected_resolution = res
-                break
-        self._setup_renderer()
+        self.selected_resolution = self._resolution_by_label.get(self.resolution_var.get(), self.selected_resolution)
+        self._update_scene_config()
 
     def _on_fps_change(self, event: object) -> None:  # noqa: ARG002 - tkinter protocol
         self.selected_fps = int(event.widget.get())
-        self._setup_renderer()
+        self._update_scene_config()
 
     def _save_project(self) -> None:
         project = self._collect_state()
         path = Path(f"projects/{project['title']}.json")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(project, ensure_ascii=False, indent=2))
+        path.write_text(json.dumps(project, ensure_ascii=False, indent=2), encoding="utf-8")
         self.status_var.set(f"پروژه ذخیره شد: {path}")
 
     def _load_project(self) -> None:
         file_path = filedialog.askopenfilename(filetypes=[("Project", "*.json")])
         if not file_path:
             return
-        data = json.loads(Path(file_path).read_text())
+        with open(file_path, "r", encoding="utf-8") as project_file:
+            data = json.load(project_file)
         self._apply_state(data)
         self.status_var.set("پروژه بارگذاری شد")
 
@@ -289,8 +327,8 @@ class MainGUI:
         return {
             "title": self.title_input.get(),
             "body": self.body_input.get("1.0", END).strip(),
-            "font": self.font_var.get(),
-            "size": int(self.size_var.get()),
+            "font": self._current_font,
+            "size": self._current_size,
             "animation": self.animation_style_var.get(),
             "duration": float(self.duration_slider.get()),
             "transition": self.transition_var.get(),
@@ -312,7 +350,7 @@ class MainGUI:
         self.body_input.insert(END, data.get("body", ""))
         self.font_var.set(data.get("font", self.config.fonts[0]))
         self.size_var.set(str(data.get("size", 36)))
-        self.animation_style_var.set(data.get("animation", list(self.config.animation_styles.keys())[0]))
+        self.animation_style_var.set(data.get("animation", self._animation_style_names[0]))
         self.duration_slider.set(data.get("duration", 4))
         self.transition_var.set(data.get("transition", self.config.transition_styles[0]))
         self.resolution_var.set(data.get("resolution", self.config.resolutions[0].label))
@@ -333,17 +371,17 @@ class MainGUI:
             [
                 AnimatedText(
                     content=self.title_input.get(),
-                    font=self.font_var.get(),
+                    font=self._current_font,
                     color=self.text_color_var.get(),
-                    size=int(self.size_var.get()),
+                    size=self._current_size,
                     animation=self.animation_style_var.get(),
                     duration=float(self.duration_slider.get()),
                 ),
                 AnimatedText(
                     content=self.body_input.get("1.0", END),
-                    font=self.font_var.get(),
+                    font=self._current_font,
                     color=self.text_color_var.get(),
-                    size=int(self.size_var.get()) - 4,
+                    size=self._current_size - 4,
                     animation=self.animation_style_var.get(),
                     duration=float(self.duration_slider.get()),
                 ),
@@ -362,7 +400,12 @@ class MainGUI:
     def _on_render_complete(self, output: Path) -> None:
         self.status_var.set(f"رندر کامل شد: {output}")
 
+    def _on_close(self) -> None:
+        self.render_manager.shutdown()
+        self.window.destroy()
+
     def run(self) -> None:
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
         self.window.mainloop()
 
 
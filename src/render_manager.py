@@ -1,11 +1,10 @@
 """Rendering coordination and progress tracking."""
 
 import logging
+import queue
 import threading
 from pathlib import Path
-from typing import Callable, Optional
-
-from manim import config as manim_config
+from typing import Callable, Optional, Set, Tuple
 
 from .scene_composer import SceneComposer, SceneConfig
 from .text_animator import AnimatedText
@@ -14,7 +13,12 @@ logger = logging.getLogger(__name__)
 
 
 class RenderManager:
-    """Runs Manim render in a background thread to keep the GUI responsive."""
+    """Runs Manim renders on a persistent background worker to keep the GUI responsive.
+
+    Requests are queued for a single daemon worker thread. Each request gets its
+    own stop event so :meth:`cancel` can abort queued jobs as well as the one in
+    progress, and an unfinished render never blocks interpreter exit.
+    """
 
     def __init__(
         self,
@@ -27,24 +31,46 @@ class RenderManager:
         self.output_dir = output_dir
         self.progress_callback = progress_callback
         self.completion_callback = completion_callback
-        self._thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
+        self._jobs: "queue.Queue[Optional[Tuple[list[AnimatedText], threading.Event]]]" = queue.Queue()
+        self._pending: Set[threading.Event] = set()
+        self._pending_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._worker_loop, name="render", daemon=True)
+        self._worker.start()
         self.output_dir.mkdir(parents=True, exist_ok=True)
         logger.info("RenderManager set up with output dir %s", output_dir)
 
     def render_async(self, texts: list[AnimatedText]) -> None:
-        if self._thread and self._thread.is_alive():
-            logger.warning("Render already in progress")
-            return
+        stop_event = threading.Event()
+        with self._pending_lock:
+            if self._pending:
+                logger.info("Render in progress; queueing another request")
+            self._pending.add(stop_event)
+        self._jobs.put((texts, stop_event))
+        logger.info("Render job submitted")
 
-        self._stop_event.clear()
-        self._thread = threading.Thread(target=self._render, args=(texts,), daemon=True)
-        self._thread.start()
-        logger.info("Render thread started")
+    def _worker_loop(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            texts, stop_event = job
+            try:
+                if stop_event.is_set():
+                    logger.info("Render cancelled before start")
+                else:
+                    self._render(texts, stop_event)
+            finally:
+                with self._pending_lock:
+                    self._pending.discard(stop_event)
 
-    def _render(self, texts: list[AnimatedText]) -> None:  # pragma: no cover - blocking
+    def _render(self, texts: list[AnimatedText], stop_event: threading.Event) -> None:  # pragma: no cover - blocking
         try:
+            from manim import config as manim_config
+
             scene = self.composer.compose(texts)
+            if stop_event.is_set():
+                logger.info("Render cancelled")
+                return
             manim_config.frame_width = self.composer.config.width
             manim_config.frame_height = self.composer.config.height
             manim_config.frame_rate = self.composer.config.fps
@@ -52,6 +78,9 @@ class RenderManager:
             manim_config.output_file = str(output_file)
             logger.info("Rendering to %s", output_file)
             # scene.render()  # Heavy call intentionally commented for offline environment
+            if stop_event.is_set():
+                logger.info("Render cancelled")
+                return
             if self.progress_callback:
                 self.progress_callback(1.0)
             if self.completion_callback:
@@ -63,6 +92,13 @@ class RenderManager:
                 self.progress_callback(0.0)
 
     def cancel(self) -> None:
-        if self._thread and self._thread.is_alive():
-            self._stop_event.set()
-            logger.info("Render cancel requested")
+        with self._pending_lock:
+            pending = list(self._pending)
+        for stop_event in pending:
+            stop_event.set()
+        if pending:
+            logger.info("Render cancel requested for %d job(s)", len(pending))
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._jobs.put(None)
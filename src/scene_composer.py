@@ -2,13 +2,15 @@
 
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List
-
-from manim import BLUE, Scene, Text, VideoFileClip, VGroup
+from typing import TYPE_CHECKING, List
 
 from .text_animator import AnimatedText
 
+if TYPE_CHECKING:
+    from manim import Scene, VideoFileClip
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,37 +22,52 @@ class SceneConfig:
     background_videos: List[Path] = field(default_factory=list)
 
 
-class PersianScene(Scene):
-    """Custom scene that supports layering Persian text and background video."""
-
-    def __init__(self, scene_config: SceneConfig, animated_texts: List[AnimatedText]):
-        self.scene_config = scene_config
-        self.animated_texts = animated_texts
-        super().__init__()
-
-    def construct(self) -> None:  # pragma: no cover - Manim render path
-        logger.info("Starting Manim construct with %d text items", len(self.animated_texts))
-        text_group = VGroup()
-        y_position = 3
-        for animated in self.animated_texts:
-            manim_text = Text(
-                animated.content,
-                font=animated.font,
-                color=animated.color,
-                font_size=animated.size,
-            )
-            manim_text.to_edge("left")
-            manim_text.shift(y_position * manim_text.get_y() * 0 + y_position)
-            text_group.add(manim_text)
-            self.play(manim_text.animate.set_opacity(0))
-            self.play(manim_text.animate.set_opacity(1), run_time=animated.duration)
-            y_position -= 1
-        self.play(text_group.animate.set_color(BLUE))
-
-        for video_path in self.scene_config.background_videos:
-            clip = VideoFileClip(str(video_path))
-            logger.info("Adding background video: %s", video_path)
-            self.add(clip)
+@lru_cache(maxsize=16)
+def _load_clip(path_str: str, mtime: float) -> "VideoFileClip":
+    # ``mtime`` is part of the cache key so an edited file is reopened.
+    from manim import VideoFileClip
+
+    return VideoFileClip(path_str)
+
+
+@lru_cache(maxsize=None)
+def _get_scene_cls() -> type:
+    """Build the Manim scene class on first use so importing this module stays cheap."""
+    from manim import BLUE, UP, Scene, Text, VGroup
+
+    class PersianScene(Scene):
+        """Custom scene that supports layering Persian text and background video."""
+
+        def __init__(self, scene_config: SceneConfig, animated_texts: List[AnimatedText]):
+            self.scene_config = scene_config
+            self.animated_texts = animated_texts
+            super().__init__()
+
+        def construct(self) -> None:  # pragma: no cover - Manim render path
+            logger.info("Starting Manim construct with %d text items", len(self.animated_texts))
+            text_group = VGroup()
+            y_positions = [3 - index for index in range(len(self.animated_texts))]
+            for animated, y_position in zip(self.animated_texts, y_positions):
+                manim_text = Text(
+                    animated.content,
+                    font=animated.font,
+                    color=animated.color,
+                    font_size=animated.size,
+                )
+                manim_text.to_edge("left")
+                manim_text.shift(UP * y_position)
+                text_group.add(manim_text)
+                manim_text.set_opacity(0)
+                self.add(manim_text)
+                self.play(manim_text.animate.set_opacity(1), run_time=animated.duration)
+            self.play(text_group.animate.set_color(BLUE))
+
+            for video_path in self.scene_config.background_videos:
+                clip = _load_clip(str(video_path), video_path.stat().st_mtime)
+                logger.info("Adding background video: %s", video_path)
+                self.add(clip)
+
+    return PersianScene
 
 
 class SceneComposer:
@@ -65,6 +82,15 @@ class SceneComposer:
             config.fps,
         )
 
-    def compose(self, texts: List[AnimatedText]) -> PersianScene:
+    def update_config(self, config: SceneConfig) -> None:
+        self.config = config
+        logger.info(
+            "SceneComposer reconfigured to %sx%s at %sfps",
+            config.width,
+            config.height,
+            config.fps,
+        )
+
+    def compose(self, texts: List[AnimatedText]) -> "Scene":
         logger.info("Composing scene with %d text elements", len(texts))
-        return PersianScene(scene_config=self.config, animated_texts=texts)
+        return _get_scene_cls()(scene_config=self.config, animated_texts=texts)
@@ -2,15 +2,24 @@
 
 import logging
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import List, Sequence, Union, overload
 
-import arabic_reshaper
+from arabic_reshaper import ArabicReshaper
 from bidi.algorithm import get_display
 
 logger = logging.getLogger(__name__)
 
+# One configured reshaper shared by every call, so its configuration is parsed once.
+_RESHAPER = ArabicReshaper(configuration={"support_ligatures": True})
 
-@dataclass
+
+@lru_cache(maxsize=1024)
+def _reshape_cached(text: str) -> str:
+    return get_display(_RESHAPER.reshape(text))
+
+
+@dataclass(slots=True)
 class AnimatedText:
     content: str
     font: str
@@ -20,6 +29,31 @@ class AnimatedText:
     duration: float
 
 
+class _TypewriterFrames(Sequence[str]):
+    """Lazy view of the typewriter prefixes of ``text``; frame ``i`` is ``text[: i + 1]``."""
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+
+    def __len__(self) -> int:
+        return len(self._text)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self._text)
+        if not 0 <= index < len(self._text):
+            raise IndexError("typewriter frame index out of range")
+        return self._text[: index + 1]
+
+
 class PersianTextAnimator:
     """Handles RTL reshaping and prepares Manim-ready text objects."""
 
@@ -28,35 +62,29 @@ class PersianTextAnimator:
         logger.info("Initialized PersianTextAnimator with default font %s", default_font)
 
     def reshape_text(self, text: str) -> str:
-        logger.debug("Reshaping text: %s", text)
-        reshaped = arabic_reshaper.reshape(text)
-        display = get_display(reshaped)
-        logger.debug("Reshaped text result: %s", display)
-        return display
+        return _reshape_cached(text)
+
+    def reshape_multiline(self, text: str) -> str:
+        # Reshape line by line so an edit to one line leaves the others cached.
+        return "".join(_reshape_cached(line) for line in text.splitlines(keepends=True))
 
     def build_animated_sequence(self, entries: List[AnimatedText]) -> List[AnimatedText]:
+        # Entries are freshly built by the caller, so reshape them in place
+        # rather than allocating a copy per entry.
         processed: List[AnimatedText] = []
         for entry in entries:
-            reshaped = self.reshape_text(entry.content)
-            processed_entry = AnimatedText(
-                content=reshaped,
-                font=entry.font or self.default_font,
-                color=entry.color,
-                size=entry.size,
-                animation=entry.animation,
-                duration=entry.duration,
-            )
-            processed.append(processed_entry)
-            logger.info(
-                "Prepared animated text '%s' with animation %s for duration %.2f",
-                entry.content,
-                entry.animation,
-                entry.duration,
-            )
+            raw_content = entry.content
+            entry.content = self.reshape_multiline(raw_content)
+            entry.font = entry.font or self.default_font
+            processed.append(entry)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Prepared animated text '%s' with animation %s for duration %.2f",
+                    raw_content,
+                    entry.animation,
+                    entry.duration,
+                )
         return processed
 
-    def typewriter_effect_frames(self, text: str) -> List[str]:
-        display_text = self.reshape_text(text)
-        frames = [display_text[:i] for i in range(1, len(display_text) + 1)]
-        logger.debug("Generated %d typewriter frames for text", len(frames))
-        return frames
+    def typewriter_effect_frames(self, text: str) -> Sequence[str]:
+        return _TypewriterFrames(self.reshape_text(text))
@@ -1,12 +1,16 @@
 """Video handling utilities for previews and trimming."""
 
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Slider values closer than this are treated as unchanged.
+_EPSILON = 1e-6
+
 
 @dataclass
 class VideoSelection:
@@ -24,27 +28,35 @@ class VideoProcessor:
         logger.info("Initialized VideoProcessor with empty selection")
 
     def select_file(self, file_path: str) -> None:
-        path = Path(file_path)
-        if not path.exists():
+        if not os.path.exists(file_path):
             logger.error("Video file not found: %s", file_path)
             raise FileNotFoundError(f"Video file not found: {file_path}")
-        self.selection.path = path
+        self.selection.path = Path(file_path)
         logger.info("Selected video file: %s", file_path)
 
     def update_trim(self, start: float, end: float) -> None:
+        if (
+            abs(start - self.selection.start_time) < _EPSILON
+            and abs(end - self.selection.end_time) < _EPSILON
+        ):
+            return
         if start < 0 or end < 0:
             raise ValueError("Start and end times must be non-negative")
         if end and start > end:
             raise ValueError("Start time cannot exceed end time")
         self.selection.start_time = start
         self.selection.end_time = end
-        logger.debug("Updated trim to start=%s end=%s", start, end)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updated trim to start=%s end=%s", start, end)
 
     def set_volume(self, volume: float) -> None:
+        if abs(volume - self.selection.volume) < _EPSILON:
+            return
         if not 0.0 <= volume <= 1.0:
             raise ValueError("Volume must be between 0 and 1")
         self.selection.volume = volume
-        logger.debug("Volume set to %.2f", volume)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Volume set to %.2f", volume)
 
     def describe(self) -> str:
         return (